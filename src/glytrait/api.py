@@ -400,7 +400,9 @@ class Experiment(_Workflow):
         Calling this method will make the `meta_property_table` attribute available.
         """
         glycans: list[str] = processed_abund_df.columns.tolist()
-        glycan_dict = cast(GlycanDict, {g: self.input_data.glycans[g] for g in glycans})
+        # `input_data.glycans` returns a copy, so only access it once.
+        all_glycans = self.input_data.glycans
+        glycan_dict = cast(GlycanDict, {g: all_glycans[g] for g in glycans})
         mp_table = build_meta_property_table(glycan_dict, self.mode, self.sia_linkage)
         return mp_table
 
@@ -549,7 +549,14 @@ class TraitFormula:
         except FormulaTermCalculationError as e:
             msg = f"Failed to calculate term: {e.term}. {str(e)}"
             raise FormulaCalculationError(msg) from e
-        return pd.concat(series_list, axis=1).prod(axis=1)
+        # Same as `pd.concat(series_list, axis=1).prod(axis=1)` for the masked
+        # dtypes all terms return ("UInt8", "Float32"), but much faster.
+        dtype = np.result_type(*(s.dtype.type for s in series_list))
+        arrays = np.stack([s.to_numpy(dtype=dtype, na_value=1) for s in series_list])
+        product = arrays.prod(axis=0)
+        if product.dtype != dtype and (product.astype(dtype) == product).all():
+            product = product.astype(dtype)
+        return pd.Series(pd.array(product), index=series_list[0].index)
 
     def calcu_trait(self, abundance_table: AbundanceTable) -> pd.Series:
         """Calculate the trait.
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Generator, Mapping, Iterator, Callable
+from functools import lru_cache
 from typing import Literal, Iterable, Optional, Final, Union, TypeVar
 
 from attrs import frozen, field
@@ -54,7 +55,7 @@ def parse_structures(__iter: Iterable[tuple[str, str]]) -> dict[str, Structure]:
             in the error message.
     """
     try:
-        result: dict[str, Structure] = _load_glycans(__iter, Structure.from_string)
+        result: dict[str, Structure] = _load_glycans(__iter, _parse_structure)
     except GlycanParseError as exc:
         raise StructureParseError(f"Could not parse structures for: {exc}.")
     else:
@@ -76,7 +77,7 @@ def parse_compositions(__iter: Iterable[tuple[str, str]]) -> dict[str, Compositi
             in the error message.
     """
     try:
-        result: dict[str, Composition] = _load_glycans(__iter, Composition.from_string)
+        result: dict[str, Composition] = _load_glycans(__iter, _parse_composition)
     except GlycanParseError as exc:
         raise CompositionParseError(f"Could not parse compositions for: {exc}.")
     else:
@@ -87,6 +88,20 @@ Glycan = TypeVar("Glycan", bound=Union["Structure", "Composition"])
 GlycanBuilder = Callable[[str, str], Glycan]
 
 
+@lru_cache(maxsize=4096)
+def _parse_structure(name: str, string: str) -> Structure:
+    # Parsing a GlycoCT string is expensive, and the same glycans are often
+    # loaded again (e.g. running the streamlit app with the same files).
+    # `Structure` is immutable, so the parsed structures can be shared.
+    return Structure.from_string(name, string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_composition(name: str, string: str) -> Composition:
+    # `Composition` is also immutable, so the same caching applies.
+    return Composition.from_string(name, string)
+
+
 def _load_glycans(
     __iter: Iterable[tuple[str, str]], builder: GlycanBuilder
 ) -> dict[str, Glycan]:
@@ -105,10 +120,14 @@ def _load_glycans(
     return glycans
 
 
-@frozen
+@frozen(cache_hash=True)
 class Structure:
     """The structure of a glycan.
 
+    The hash of a `Structure` is computed from the GlycoCT string of
+    the underlying glypy glycan, which is expensive.
+    It is therefore computed once and cached.
+
     Attributes:
         name (str): The name of the glycan.
         composition (dict): The composition of the glycan.
@@ -123,6 +142,9 @@ class Structure:
     name: str = field()
     _glypy_glycan: GlypyGlycan = field(repr=False)
     _composition: dict[str, int] = field(init=False, repr=False, hash=False)
+    _traversal_cache: dict[str, list[tuple[str, MonosaccharideResidue]]] = field(
+        init=False, factory=dict, repr=False, eq=False, hash=False
+    )
 
     def __attrs_post_init__(self):
         self._init_composition()
@@ -181,13 +203,7 @@ class Structure:
         skip: Optional[Iterable[str]] = None,
         only: Optional[Iterable[str]] = None,
     ) -> Generator[MonosaccharideResidue, None, None]:
-        # set the traversal method
-        if method == "bfs":
-            traversal_func = self._glypy_glycan.breadth_first_traversal
-        elif method == "dfs":
-            traversal_func = self._glypy_glycan.depth_first_traversal
-        else:
-            raise ValueError(f"Unknown traversal method: {method}")
+        nodes = self._traversal_nodes(method)
 
         # check the validation of `skip` and `only`
         if skip and only:
@@ -195,16 +211,36 @@ class Structure:
 
         # traverse the glycan
         if skip is None and only is None:
-            yield from traversal_func()
+            for _, node in nodes:
+                yield node
         elif skip is not None:
-            for node in traversal_func():
-                if get_mono_str(node) not in skip:
+            for mono_str, node in nodes:
+                if mono_str not in skip:
                     yield node
         else:  # only is not None
-            for node in traversal_func():
-                if get_mono_str(node) in only:  # type: ignore
+            for mono_str, node in nodes:
+                if mono_str in only:  # type: ignore
                     yield node
 
+    def _traversal_nodes(
+        self, method: Literal["bfs", "dfs"]
+    ) -> list[tuple[str, MonosaccharideResidue]]:
+        # Walking the glypy glycan and getting the name of each residue is
+        # expensive, and the meta-properties traverse the same glycan many times.
+        # The glycan never changes, so the nodes are collected once per method.
+        if method not in self._traversal_cache:
+            # set the traversal method
+            if method == "bfs":
+                traversal_func = self._glypy_glycan.breadth_first_traversal
+            elif method == "dfs":
+                traversal_func = self._glypy_glycan.depth_first_traversal
+            else:
+                raise ValueError(f"Unknown traversal method: {method}")
+            self._traversal_cache[method] = [
+                (get_mono_str(node), node) for node in traversal_func()
+            ]
+        return self._traversal_cache[method]
+
     def breadth_first_traversal(
         self,
         *,
@@ -249,6 +285,10 @@ class Structure:
         return self._composition.copy()
 
 
+# Patterns for parsing composition strings, e.g. "H5N4F1S1".
+_COMP_STRING_PATTERN: Final = re.compile(r"([A-Z]\d+)*")
+_MONO_NUM_PATTERN: Final = re.compile(r"([A-Z])(\d+)")
+
 VALID_MONOS: Final = ["H", "N", "F", "S", "L", "E"]
 
 
@@ -361,13 +401,11 @@ class Composition(Mapping[str, int]):
         """
         if string == "":
             raise CompositionParseError("Empty string.")
-        pattern = r"^([A-Z]\d+)*$"
-        if not re.fullmatch(pattern, string):
+        if not _COMP_STRING_PATTERN.fullmatch(string):
             raise CompositionParseError(f"Invalid composition: {string}.")
         mono_comp: dict[str, int] = {}
-        pattern = r"([A-Z])(\d+)"
-        for m in re.finditer(pattern, string):
-            mono_comp[m.group(1)] = int(m.group(2))
+        for mono, num in _MONO_NUM_PATTERN.findall(string):
+            mono_comp[mono] = int(num)
         return cls(name, mono_comp)  # type: ignore
 
     def __getitem__(self, __key: str) -> int:
@@ -22,8 +22,8 @@ Currently, the following meta-properties are supported:
 from __future__ import annotations
 
 from enum import Enum, auto
-from functools import singledispatch, cache
-from typing import Literal, ClassVar, Type
+from functools import singledispatch, cache, lru_cache
+from typing import Literal, ClassVar, Type, cast
 
 import pandas as pd
 from attrs import define
@@ -58,14 +58,29 @@ def build_meta_property_table(
 
     Returns:
         MetaPropertyTable: The table of meta-properties.
+
+    Notes:
+        The tables are cached by the glycans and the meta-properties to calculate,
+        so building the table for the same glycans again is cheap.
+        A copy of the cached table is returned.
     """
+    mp_names = tuple(available_meta_properties(mode, sia_linkage))
+    mp_table_df = _build_meta_property_table(tuple(glycans.items()), mp_names)
+    return MetaPropertyTable(mp_table_df.copy())
+
+
+@lru_cache(maxsize=8)
+def _build_meta_property_table(
+    glycan_items: tuple[tuple[str, Structure | Composition], ...],
+    mp_names: tuple[str, ...],
+) -> pd.DataFrame:
+    glycans = cast(GlycanDict, dict(glycan_items))
     mp_series_list: list[pd.Series] = []
-    for mp_name in available_meta_properties(mode, sia_linkage):
+    for mp_name in mp_names:
         mp = get_meta_property(mp_name)
         s = mp.calculate_many(glycans)
         mp_series_list.append(s)
-    mp_table_df = pd.concat(mp_series_list, axis=1)
-    return MetaPropertyTable(mp_table_df)
+    return pd.concat(mp_series_list, axis=1)
 
 
 class GlycanType(Enum):
@@ -5,6 +5,8 @@ The only high-level function that client code will use is `preprocess`.
 
 from typing import Literal, Protocol
 
+import numpy as np
+import pandas as pd
 from attrs import define, field
 from attrs.validators import in_
 
@@ -99,16 +101,33 @@ class Impute(ProcessingStep):
         if self.method == "zero":
             imputed_df = data.fillna(0)
         elif self.method == "min":
-            imputed_df = data.fillna(data.min())
+            imputed_df = _fillna_by_column(data, data.min())
         elif self.method == "lod":
-            imputed_df = data.fillna(data.min() / 5)
+            imputed_df = _fillna_by_column(data, data.min() / 5)
         elif self.method == "mean":
-            imputed_df = data.fillna(data.mean())
+            imputed_df = _fillna_by_column(data, data.mean())
         elif self.method == "median":
-            imputed_df = data.fillna(data.median())
+            imputed_df = _fillna_by_column(data, data.median())
         return AbundanceTable(imputed_df)
 
 
+def _fillna_by_column(data: AbundanceTable, values: pd.Series) -> AbundanceTable:
+    # `DataFrame.fillna` with a Series fills the columns one by one in Python,
+    # which is slow for tables with hundreds of glycans.
+    # Filling the underlying array at once is much faster.
+    arr = data.to_numpy(dtype=float, na_value=np.nan)
+    fill_values = values.to_numpy(dtype=float, na_value=np.nan)
+    arr = np.where(np.isnan(arr), fill_values, arr)
+    filled = pd.DataFrame(arr, index=data.index, columns=data.columns)
+    # Cast back the columns that are not float64 (usually none).
+    other_dtypes = {
+        col: dtype for col, dtype in data.dtypes.items() if dtype != np.float64
+    }
+    if other_dtypes:
+        filled = filled.astype(other_dtypes)
+    return AbundanceTable(filled)
+
+
 @define
 class Normalize(ProcessingStep):
     """Normalize the abundance table by dividing the sum of each sample."""
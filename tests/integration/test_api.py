@@ -1,19 +1,28 @@
 import pytest
 import pandas as pd
+from attrs import evolve
 
 from glytrait.api import Experiment
 
 
 class TestExperiment:
 
-    @pytest.fixture
-    def experiment(self):
+    @pytest.fixture(scope="class")
+    def input_data(self):
+        # Reading the files and parsing the structures is done only once.
+        # This object must never be modified, see `experiment` below.
         return Experiment(
             abundance_file="tests/integration/data/abundance.csv",
             glycan_file="tests/integration/data/structures.csv",
             group_file="tests/integration/data/groups.csv",
             mode="structure",
-        )
+        ).input_data
+
+    @pytest.fixture
+    def experiment(self, input_data):
+        # Each test gets its own copy, as the `Experiment` setters
+        # write into the input data.
+        return Experiment(input_data=evolve(input_data), mode="structure")
 
     def test_run_workflow(self, experiment):
         experiment.run_workflow()
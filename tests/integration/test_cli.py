@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 import pandas as pd
@@ -9,10 +10,7 @@ from glytrait.cli import cli
 
 def copy_data_file(from_: str | Path, to_: str | Path):
     """Copy data file to a new location."""
-    with open(from_, "r") as f:
-        data = f.read()
-    with open(to_, "w") as f:
-        f.write(data)
+    shutil.copyfile(from_, to_)
 
 
 @pytest.fixture
@@ -28,10 +26,14 @@ def prepared_path(tmp_path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
 class TestCLI:
 
-    def test_basic(self, prepared_path):
-        runner = CliRunner()
+    def test_basic(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -51,8 +53,7 @@ class TestCLI:
         )
         assert "CE" not in df.columns
 
-    def test_group(self, prepared_path):
-        runner = CliRunner()
+    def test_group(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -72,8 +73,7 @@ class TestCLI:
         ).exists()
         assert (prepared_path / "abundance_glytrait/meta_properties.csv").exists()
 
-    def test_formula_file(self, prepared_path):
-        runner = CliRunner()
+    def test_formula_file(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -95,8 +95,7 @@ class TestCLI:
         )
         assert df.shape[1] == 8
 
-    def test_mode(self, prepared_path):
-        runner = CliRunner()
+    def test_mode(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "compositions.csv"),
@@ -118,8 +117,7 @@ class TestCLI:
         )
         assert "Hb" in df.columns
 
-    def test_output(self, prepared_path):
-        runner = CliRunner()
+    def test_output(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -133,8 +131,7 @@ class TestCLI:
         assert (prepared_path / "output/glycan_abundance_processed.csv").exists()
         assert (prepared_path / "output/meta_properties.csv").exists()
 
-    def test_sia_linkage(self, prepared_path):
-        runner = CliRunner()
+    def test_sia_linkage(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -155,8 +152,7 @@ class TestCLI:
         )
         assert "CE" in df.columns
 
-    def test_no_filter(self, prepared_path):
-        runner = CliRunner()
+    def test_no_filter(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -170,8 +166,7 @@ class TestCLI:
         ).exists()
         assert (prepared_path / "abundance_glytrait/meta_properties.csv").exists()
 
-    def test_no_filter_has_groups(self, prepared_path):
-        runner = CliRunner()
+    def test_no_filter_has_groups(self, runner, prepared_path):
         args = [
             str(prepared_path / "abundance.csv"),
             str(prepared_path / "structures.csv"),
@@ -189,16 +184,14 @@ class TestCLI:
         assert not (prepared_path / "abundance_glytrait/anova.csv").exists()
         assert "Warning" in result.output
 
-    def test_built_in_formulas(self, tmp_path):
-        runner = CliRunner()
+    def test_built_in_formulas(self, runner, tmp_path):
         args = ["-b", str(tmp_path)]
         result = runner.invoke(cli, args)
         assert result.exit_code == 0
         assert (tmp_path / "struc_builtin_formulas.txt").exists()
         assert (tmp_path / "comp_builtin_formulas.txt").exists()
 
-    def test_welcome_msg(self):
-        runner = CliRunner()
+    def test_welcome_msg(self, runner):
         result = runner.invoke(cli, [])
         assert result.exit_code == 0
         assert "Welcome to GlyTrait!" in result.output
@@ -3,6 +3,11 @@ import pytest
 import glytrait.formula as fml
 
 
+@pytest.fixture(scope="module")
+def parser():
+    return fml.FormulaParser()
+
+
 @pytest.mark.parametrize(
     "expr, numerators, denominators",
     [
@@ -93,8 +98,7 @@ import glytrait.formula as fml
         ),
     ],
 )
-def test_parse_formula(expr, numerators, denominators):
-    parser = fml.FormulaParser()
+def test_parse_formula(parser, expr, numerators, denominators):
     result_f = parser.parse(expr)
     assert result_f.name == "T"
     assert set(t.expr for t in result_f.numerators) == numerators
@@ -4,6 +4,12 @@ from glytrait import formula as fml
 from glytrait import post_filtering as pf
 
 
+@pytest.fixture(scope="module")
+def formula_map():
+    formulas = fml.load_default_formulas("structure", sia_linkage=True)
+    return {f.name: f for f in formulas}
+
+
 @pytest.mark.parametrize(
     "trait1, trait2, expected",
     [
@@ -18,9 +24,7 @@ from glytrait import post_filtering as pf
         ("A2FSG", "A2G", False),
     ],
 )
-def test_is_child_of(trait1, trait2, expected):
-    formulas = fml.load_default_formulas("structure", sia_linkage=True)
-    formula_map = {f.name: f for f in formulas}
+def test_is_child_of(formula_map, trait1, trait2, expected):
     formulas1 = formula_map[trait1]
     formulas2 = formula_map[trait2]
     assert pf._is_child_of(formulas1, formulas2) == expected
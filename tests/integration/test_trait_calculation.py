@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from glytrait import Experiment, load_data
 
@@ -66,30 +67,70 @@ abundance_df = pd.DataFrame(
         "H4N4F3S1": [1.0, 2.0, 1.0, 2.0, 1.0],
     }
 )
+TRAITS = [
+    (
+        "CS",
+        "CS = [nS] // [type == 'complex']",
+        (
+            abundance_df["H5N4S2"] * 2
+            + abundance_df["H5N5F1S1"]
+            + abundance_df["H6N6F1S1"]
+            + abundance_df["H4N4F3S1"]
+        )
+        / (
+            abundance_df["H5N4S2"]
+            + abundance_df["H5N5F1S1"]
+            + abundance_df["H6N6F1S1"]
+            + abundance_df["H4N4F3S1"]
+        ),
+    ),
+    (
+        "CGS",
+        "CGS = [nS / nG] // [type == 'complex']",
+        (
+            abundance_df["H5N4S2"]
+            + abundance_df["H5N5F1S1"] / 2
+            + abundance_df["H6N6F1S1"] / 3
+            + abundance_df["H4N4F3S1"]
+        )
+        / (
+            abundance_df["H5N4S2"]
+            + abundance_df["H5N5F1S1"]
+            + abundance_df["H6N6F1S1"]
+            + abundance_df["H4N4F3S1"]
+        ),
+    ),
+    (
+        "A2Fc",
+        "A2Fc = [nFc > 0] // [(type == 'complex') * (nAnt == 2)]",
+        (abundance_df["H5N5F1S1"] + abundance_df["H4N4F3S1"])
+        / (
+            abundance_df["H5N5F1S1"] + abundance_df["H4N4F3S1"] + abundance_df["H5N4S2"]
+        ),
+    ),
+]
+SAMPLES = pd.Index(["S1", "S2", "S3", "S4", "S5"], name="Sample")
 
 
-def test_calculate_traits():
+@pytest.fixture(scope="module")
+def experiment():
     input_data = load_data(abundance_df=abundance_df, glycan_df=glycan_df)
     experiment = Experiment(input_data=input_data)
     experiment.preprocess()
+    return experiment
 
-    expressions = [
-        "CS = [nS] // [type == 'complex']",
-        "CGS = [nS / nG] // [type == 'complex']",
-        "A2Fc = [nFc > 0] // [(type == 'complex') * (nAnt == 2)]",
-    ]
-    result = experiment.try_formulas(expressions, squeeze=False)
 
-    ad = abundance_df
+@pytest.mark.parametrize("name, expression, expected", TRAITS)
+def test_calculate_traits(experiment, name, expression, expected):
+    result = experiment.try_formulas(expression)
+    expected = pd.Series(expected.values, index=SAMPLES, name=name)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_calculate_traits_as_frame(experiment):
+    expressions = [expression for _, expression, _ in TRAITS]
+    result = experiment.try_formulas(expressions, squeeze=False)
     expected = pd.DataFrame(
-        {
-            "CS": ((ad["H5N4S2"] * 2 + ad["H5N5F1S1"] + ad["H6N6F1S1"] + ad["H4N4F3S1"]) /
-                   (ad["H5N4S2"] + ad["H5N5F1S1"] + ad["H6N6F1S1"] + ad["H4N4F3S1"])).values,
-            "CGS": ((ad["H5N4S2"] + ad["H5N5F1S1"] / 2 + ad["H6N6F1S1"] / 3 + ad["H4N4F3S1"]) /
-                    (ad["H5N4S2"] + ad["H5N5F1S1"] + ad["H6N6F1S1"] + ad["H4N4F3S1"])).values,
-            "A2Fc": ((ad["H5N5F1S1"] + ad["H4N4F3S1"]) /
-                     (ad["H5N5F1S1"] + ad["H4N4F3S1"] + ad["H5N4S2"])).values,
-        },
-        index=pd.Index(["S1", "S2", "S3", "S4", "S5"], name="Sample")
+        {name: values.values for name, _, values in TRAITS}, index=SAMPLES
     )
     pd.testing.assert_frame_equal(result, expected)
@@ -1,18 +1,24 @@
+from functools import cache
+
 import pytest
 
 from glytrait import glycan as glyc
 
 
-@pytest.fixture
+# Structures and compositions are immutable,
+# so the same instance can be shared by all tests.
+@pytest.fixture(scope="session")
 def make_structure():
+    @cache
     def _make_structure(string, format="glycoct"):
         return glyc.Structure.from_string("glycan", string, format=format)
 
     return _make_structure
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_composition():
+    @cache
     def _make_composition(string):
         return glyc.Composition.from_string(string, string)
 
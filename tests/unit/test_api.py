@@ -362,10 +362,13 @@ class TestExperiment:
 
     @pytest.fixture
     def patch_for_run_workflow(self, mocker):
-        mocker.patch("glytrait.api.Experiment.preprocess")
-        mocker.patch("glytrait.api.Experiment.derive_traits")
-        mocker.patch("glytrait.api.Experiment.post_filter")
-        mocker.patch("glytrait.api.Experiment.diff_analysis")
+        mocker.patch.multiple(
+            "glytrait.api.Experiment",
+            preprocess=mocker.DEFAULT,
+            derive_traits=mocker.DEFAULT,
+            post_filter=mocker.DEFAULT,
+            diff_analysis=mocker.DEFAULT,
+        )
 
     @pytest.mark.usefixtures("patch_for_run_workflow")
     def test_run_workflow_with_groups_no_args(self, input_data):
@@ -20,7 +20,8 @@ def write_content(clean_dir):
     return _write_content
 
 
-@pytest.fixture
+# Only read by the tests, so it is built once for the module.
+@pytest.fixture(scope="module")
 def mp_table() -> pd.DataFrame:
     data = {
         "mp_int": [1, 2, 3],
@@ -457,7 +458,7 @@ class TestTraitFormula:
         formula = fml.TraitFormula("F", numerators, denominators)
         assert formula.sia_linkage == expected
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def abund_table(self):
         #      G1  G2  G3
         # S1   1   2   2
@@ -471,6 +472,30 @@ class TestTraitFormula:
         }
         return pd.DataFrame(data, index=["S1", "S2", "S3"])
 
+    @pytest.mark.parametrize(
+        "terms",
+        [
+            [fml.NumericalTerm("nS"), fml.NumericalTerm("nF")],
+            [
+                fml.NumericalTerm("nS"),
+                fml.DivisionTermWrapper(fml.NumericalTerm("nG")),
+                fml.NumericalTerm("nF"),
+            ],
+        ],
+        ids=["uint8", "with_division"],
+    )
+    def test_initialize_same_as_prod(self, terms):
+        # The last glycan has no values at all.
+        mp_df = pd.DataFrame(
+            {"nS": [3, 1, None], "nG": [3, 3, None], "nF": [1, 2, None]},
+            index=["G1", "G2", "G3"],
+            dtype="UInt8",
+        )
+        result = fml.TraitFormula._initialize(mp_df, terms)
+        series_list = [term(mp_df) for term in terms]
+        expected = pd.concat(series_list, axis=1).prod(axis=1)
+        pd.testing.assert_series_equal(result, expected, check_exact=True)
+
     def test_initialize_failed(self, mp_table):
         numerators = [fml.NumericalTerm("mp_not_exist")]
         denominators = [fml.NumericalTerm("1")]
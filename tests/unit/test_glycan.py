@@ -21,6 +21,14 @@ class TestLoadStructures:
         msg = "Could not parse structures for: 'test_2', 'test_3'."
         assert msg == str(excinfo.value)
 
+    def test_cached(self):
+        names = ["test_1", "test_2"]
+        glycocts = [ct.test_glycoct_1, ct.test_glycoct_2]
+        result1 = glyc.parse_structures(zip(names, glycocts))
+        result2 = glyc.parse_structures(zip(names, glycocts))
+        assert result1["test_1"] is result2["test_1"]
+        assert result1["test_2"] is result2["test_2"]
+
 
 class TestLoadCompositions:
     def test_normal(self):
@@ -38,6 +46,14 @@ class TestLoadCompositions:
         msg = "Could not parse compositions for: 'test_2', 'test_3'."
         assert msg == str(excinfo.value)
 
+    def test_cached(self):
+        names = ["test_1", "test_2"]
+        comps = ["H5N4F1S1", "H5N4"]
+        result1 = glyc.parse_compositions(zip(names, comps))
+        result2 = glyc.parse_compositions(zip(names, comps))
+        assert result1["test_1"] is result2["test_1"]
+        assert result1["test_2"] is result2["test_2"]
+
 
 class TestGlycan:
     def test_from_string(self):
@@ -166,6 +182,10 @@ class TestGlycan:
                 pass
         assert "Unknown traversal method: wrong" in str(excinfo.value)
 
+    def test_traversal_cached(self, make_structure):
+        glycan = make_structure(ct.test_glycoct_1)
+        assert glycan._traversal_nodes("bfs") is glycan._traversal_nodes("bfs")
+
     def test_composition(self, make_structure):
         glycan = make_structure(ct.test_glycoct_1)
         assert dict(glycan.composition) == {
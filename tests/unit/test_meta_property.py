@@ -50,6 +50,32 @@ def test_build_meta_property_table(mocker):
     pd.testing.assert_frame_equal(result, expected)
 
 
+def test_build_meta_property_table_cached(mocker, make_composition):
+    calculate_many_spy = mocker.spy(mp.MetaProperty, "calculate_many")
+    mp._build_meta_property_table.cache_clear()
+    glycans = {"G1": make_composition("H5N4"), "G2": make_composition("H5N4F1")}
+
+    result1 = mp.build_meta_property_table(glycans, "composition")
+    n_calls = calculate_many_spy.call_count
+    result2 = mp.build_meta_property_table(dict(glycans), "composition")
+
+    assert n_calls > 0
+    assert calculate_many_spy.call_count == n_calls
+    pd.testing.assert_frame_equal(result1, result2)
+    assert result1 is not result2
+
+
+def test_build_meta_property_table_after_register(request, make_composition):
+    glycans = {"G1": make_composition("H5N4"), "G2": make_composition("H5N4F1")}
+
+    result1 = mp.build_meta_property_table(glycans, "composition")
+    request.getfixturevalue("register_some_mp")
+    result2 = mp.build_meta_property_table(glycans, "composition")
+
+    assert "some_mp" not in result1.columns
+    assert "some_mp" in result2.columns
+
+
 @pytest.fixture
 def register_some_mp():
     @mp.register
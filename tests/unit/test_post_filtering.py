@@ -81,6 +81,18 @@ def test_relationship_matrix(mocker):
     assert np.array_equal(result, expected)
 
 
+@pytest.fixture(scope="module")
+def corr_df():
+    return pd.DataFrame(
+        {
+            "trait1": [1, 2, 3, 4, 5],
+            "trait2": [1, 2, 3, 4, 5],  # 完全与trait1相关
+            "trait3": [5, 4, 3, 2, 1],  # 完全与trait1负相关
+            "trait4": [2, 3, 1, 5, 4],  # 与trait1的相关性为0.6
+        }
+    )
+
+
 @pytest.mark.parametrize(
     "threshold, expected",
     [
@@ -112,19 +124,33 @@ def test_relationship_matrix(mocker):
         ),
     ],
 )
-def test_correlation_matrix(threshold, expected):
-    df = pd.DataFrame(
-        {
-            "trait1": [1, 2, 3, 4, 5],
-            "trait2": [1, 2, 3, 4, 5],  # 完全与trait1相关
-            "trait3": [5, 4, 3, 2, 1],  # 完全与trait1负相关
-            "trait4": [2, 3, 1, 5, 4],  # 与trait1的相关性为0.6
-        }
-    )
-    result = pf._correlation_matrix(df, threshold, method="pearson")
+def test_correlation_matrix(corr_df, threshold, expected):
+    result = pf._correlation_matrix(corr_df, threshold, method="pearson")
     assert np.array_equal(result, expected)
 
 
+# Return values of the mocked `_relationship_matrix` and `_correlation_matrix`.
+# They are made read-only, as `filter_colinearity` should not modify them.
+RELATIONSHIP_MATRIX = np.array(
+    [
+        [0, 1, 0, 1],
+        [0, 0, 1, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+    ]
+)
+RELATIONSHIP_MATRIX.setflags(write=False)
+CORRELATION_MATRIX = np.array(
+    [
+        [1, 1, 0, 1],
+        [1, 1, 0, 1],
+        [0, 0, 1, 0],
+        [1, 1, 0, 1],
+    ]
+)
+CORRELATION_MATRIX.setflags(write=False)
+
+
 def test_filter_colinearity(mocker):
     trait_table = pd.DataFrame(
         {  # This df is just a place-holder. The values are not important.
@@ -136,26 +162,12 @@ def test_filter_colinearity(mocker):
     )
     relationship_matrix_mock = mocker.patch(
         "glytrait.post_filtering._relationship_matrix",
-        return_value=np.array(
-            [
-                [0, 1, 0, 1],
-                [0, 0, 1, 0],
-                [0, 0, 0, 0],
-                [0, 0, 0, 0],
-            ]
-        ),
+        return_value=RELATIONSHIP_MATRIX,
         autospec=True,
     )
     correlation_matrix_mock = mocker.patch(
         "glytrait.post_filtering._correlation_matrix",
-        return_value=np.array(
-            [
-                [1, 1, 0, 1],
-                [1, 1, 0, 1],
-                [0, 0, 1, 0],
-                [1, 1, 0, 1],
-            ]
-        ),
+        return_value=CORRELATION_MATRIX,
         autospec=True,
     )
     result_df = pf.filter_colinearity("formulas", trait_table, 0.5, "pearson")
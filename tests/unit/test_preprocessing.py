@@ -19,6 +19,19 @@ def test_filter(data, max_na):
     assert np.sum(result.isna().mean() > max_na) == 0
 
 
+# Shared by all imputation methods. `Impute` does not modify its input.
+@pytest.fixture(scope="module")
+def impute_data():
+    return pd.DataFrame(
+        {
+            "Glycan1": [0.1, 0.2, None, 0.4],
+            "Glycan2": [0.2, None, None, 0.5],
+            "Glycan3": [0.3, 0.4, 0.5, 0.6],
+        },
+        index=pd.Index(["S1", "S2", "S3", "S4"], name="Sample"),
+    )
+
+
 @pytest.mark.parametrize(
     "method, expected",
     [
@@ -79,18 +92,27 @@ def test_filter(data, max_na):
         ),
     ],
 )
-def test_impute(method, expected):
+def test_impute(method, expected, impute_data):
+    original = impute_data.copy()
+    imputer = pp.Impute(method=method)
+    result = imputer(impute_data)
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(impute_data, original)
+
+
+@pytest.mark.parametrize("method", ["zero", "min", "lod", "mean", "median"])
+def test_impute_keeps_dtypes(method):
     data = pd.DataFrame(
         {
-            "Glycan1": [0.1, 0.2, None, 0.4],
-            "Glycan2": [0.2, None, None, 0.5],
-            "Glycan3": [0.3, 0.4, 0.5, 0.6],
+            "Glycan1": pd.array([1, 2, 3], dtype="int64"),
+            "Glycan2": pd.array([0.1, None, 0.3], dtype="float64"),
+            "Glycan3": pd.array([0.1, None, 0.3], dtype="Float64"),
         },
-        index=pd.Index(["S1", "S2", "S3", "S4"], name="Sample"),
+        index=pd.Index(["S1", "S2", "S3"], name="Sample"),
     )
-    imputer = pp.Impute(method=method)
-    result = imputer(data)
-    pd.testing.assert_frame_equal(result, expected)
+    result = pp.Impute(method=method)(data)
+    pd.testing.assert_series_equal(result.dtypes, data.dtypes)
+    assert not result.isna().any().any()
 
 
 def test_unknown_impute_method():